@@ -1,7 +1,8 @@
 import { useState, useEffect, useRef } from 'react'
 import { supabase } from '../lib/supabase'
+import { LANGUAGES, getLangInfo } from '../lib/languages'
 import { startRealtime, RealtimeHandle } from '../lib/realtime'
-import { RingToneGenerator, playNotificationSound } from '../lib/audio'
+import { RingToneGenerator, playNotificationSound, warmUpAudio } from '../lib/audio'
 import { Button } from './ui/button'
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card'
 import { Badge } from './ui/badge'
@@ -12,15 +13,6 @@ import {
   LogOut, Headphones, Languages, Clock, User, UserCheck 
 } from 'lucide-react'
 
-const LANGUAGES = [
-  { code: 'marathi', label: 'मराठी (Marathi)', flag: '🇮🇳' },
-  { code: 'spanish', label: 'Español (Spanish)', flag: '🇪🇸' },
-  { code: 'english', label: 'English', flag: '🇺🇸' },
-  { code: 'hindi', label: 'हिन्दी (Hindi)', flag: '🇮🇳' },
-  { code: 'french', label: 'Français (French)', flag: '🇫🇷' },
-  { code: 'german', label: 'Deutsch (German)', flag: '🇩🇪' },
-]
-
 type CallState = 'idle' | 'incoming' | 'connected' | 'ended'
 
 export default function AgentDashboard() {
@@ -37,6 +29,8 @@ export default function AgentDashboard() {
   const [isAvailable, setIsAvailable] = useState(true)
 
   const realtimeRef = useRef<RealtimeHandle | null>(null)
+  // Source of truth for mute; the realtime handle may not exist yet when the button is pressed
+  const mutedRef = useRef(false)
   const ringToneRef = useRef<RingToneGenerator | null>(null)
   const timerRef = useRef<NodeJS.Timeout | null>(null)
   const subscriptionRef = useRef<any>(null)
@@ -126,7 +120,7 @@ export default function AgentDashboard() {
       
       toast({
         title: 'Incoming Call!',
-        description: `Caller speaking ${LANGUAGES.find(l => l.code === session.caller_language)?.label}`,
+        description: `Caller speaking ${getLangInfo(session.caller_language)?.label}`,
       })
 
       // Update session to ringing
@@ -148,6 +142,7 @@ export default function AgentDashboard() {
     try {
       if (!currentSession) return
 
+      warmUpAudio()
       setCallState('connected')
       ringToneRef.current?.stop()
 
@@ -197,6 +192,8 @@ export default function AgentDashboard() {
       }
       
       setIsListening(false)
+      mutedRef.current = false
+      setIsMuted(false)
       setCurrentSpeech('')
       setCurrentTranslation('')
 
@@ -216,7 +213,7 @@ export default function AgentDashboard() {
 
   const initializeWebRTC = async () => {
     try {
-      const callerLang = LANGUAGES.find(l => l.code === currentSession.caller_language)?.label || 'Marathi'
+      const callerLang = getLangInfo(currentSession.caller_language)?.label || 'Marathi'
       
       const handle = await startRealtime({
         targetLanguage: callerLang,
@@ -237,6 +234,7 @@ export default function AgentDashboard() {
         }
       })
 
+      handle.setMuted(mutedRef.current)
       realtimeRef.current = handle
       setIsListening(true)
     } catch (error: any) {
@@ -255,12 +253,17 @@ export default function AgentDashboard() {
     return `${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`
   }
 
+  const toggleMute = () => {
+    const muted = !mutedRef.current
+    mutedRef.current = muted
+    realtimeRef.current?.setMuted(muted)
+    setIsMuted(muted)
+  }
+
   const handleLogout = async () => {
     await supabase.auth.signOut()
   }
 
-  const getLangInfo = (code: string) => LANGUAGES.find(l => l.code === code)
-
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-50 to-slate-100">
       {/* Header */}
@@ -363,7 +366,7 @@ export default function AgentDashboard() {
                   <Button
                     variant="outline"
                     size="sm"
-                    onClick={() => setIsMuted(!isMuted)}
+                    onClick={toggleMute}
                     className={isMuted ? 'bg-red-50 border-red-200' : ''}
                   >
                     {isMuted ? <MicOff className="w-4 h-4 mr-2" /> : <Mic className="w-4 h-4 mr-2" />}
@@ -1,7 +1,8 @@
 import { useState, useEffect, useRef } from 'react'
 import { supabase } from '../lib/supabase'
+import { LANGUAGES, getLangInfo } from '../lib/languages'
 import { startRealtime, RealtimeHandle } from '../lib/realtime'
-import { RingToneGenerator, playNotificationSound } from '../lib/audio'
+import { RingToneGenerator, playNotificationSound, warmUpAudio } from '../lib/audio'
 import { Button } from './ui/button'
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card'
 import { Badge } from './ui/badge'
@@ -12,15 +13,6 @@ import {
   LogOut, User, Languages, Clock, PhoneCall 
 } from 'lucide-react'
 
-const LANGUAGES = [
-  { code: 'marathi', label: 'मराठी (Marathi)', flag: '🇮🇳' },
-  { code: 'spanish', label: 'Español (Spanish)', flag: '🇪🇸' },
-  { code: 'english', label: 'English', flag: '🇺🇸' },
-  { code: 'hindi', label: 'हिन्दी (Hindi)', flag: '🇮🇳' },
-  { code: 'french', label: 'Français (French)', flag: '🇫🇷' },
-  { code: 'german', label: 'Deutsch (German)', flag: '🇩🇪' },
-]
-
 type CallState = 'idle' | 'waiting' | 'ringing' | 'connected' | 'ended'
 
 export default function CallerDashboard() {
@@ -36,6 +28,8 @@ export default function CallerDashboard() {
   const [isListening, setIsListening] = useState(false)
 
   const realtimeRef = useRef<RealtimeHandle | null>(null)
+  // Source of truth for mute; the realtime handle may not exist yet when the button is pressed
+  const mutedRef = useRef(false)
   const ringToneRef = useRef<RingToneGenerator | null>(null)
   const timerRef = useRef<NodeJS.Timeout | null>(null)
 
@@ -90,6 +84,7 @@ export default function CallerDashboard() {
 
   const startCall = async () => {
     try {
+      warmUpAudio()
       setCallState('waiting')
       toast({ title: 'Requesting call...', description: 'Looking for available agent' })
 
@@ -175,6 +170,8 @@ export default function CallerDashboard() {
       }
       
       setIsListening(false)
+      mutedRef.current = false
+      setIsMuted(false)
       setCurrentSpeech('')
       setCurrentTranslation('')
 
@@ -191,7 +188,7 @@ export default function CallerDashboard() {
 
   const initializeWebRTC = async (session: any) => {
     try {
-      const agentLang = LANGUAGES.find(l => l.code === session.agent_language)?.label || 'Spanish'
+      const agentLang = getLangInfo(session.agent_language)?.label || 'Spanish'
       
       const handle = await startRealtime({
         targetLanguage: agentLang,
@@ -212,6 +209,7 @@ export default function CallerDashboard() {
         }
       })
 
+      handle.setMuted(mutedRef.current)
       realtimeRef.current = handle
       setIsListening(true)
     } catch (error: any) {
@@ -224,12 +222,17 @@ export default function CallerDashboard() {
     }
   }
 
+  const toggleMute = () => {
+    const muted = !mutedRef.current
+    mutedRef.current = muted
+    realtimeRef.current?.setMuted(muted)
+    setIsMuted(muted)
+  }
+
   const handleLogout = async () => {
     await supabase.auth.signOut()
   }
 
-  const getLangInfo = (code: string) => LANGUAGES.find(l => l.code === code)
-
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-50 to-slate-100">
       {/* Header */}
@@ -317,7 +320,7 @@ export default function CallerDashboard() {
                   <Button
                     variant="outline"
                     size="sm"
-                    onClick={() => setIsMuted(!isMuted)}
+                    onClick={toggleMute}
                     className={isMuted ? 'bg-red-50 border-red-200' : ''}
                   >
                     {isMuted ? <MicOff className="w-4 h-4 mr-2" /> : <Mic className="w-4 h-4 mr-2" />}
@@ -1,5 +1,6 @@
 import { useState } from 'react'
 import { supabase } from '../lib/supabase'
+import { LANGUAGES } from '../lib/languages'
 import { Button } from './ui/button'
 import { Input } from './ui/input'
 import { Label } from './ui/label'
@@ -9,15 +10,6 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '.
 import { useToast } from '../hooks/use-toast'
 import { Phone, Headphones } from 'lucide-react'
 
-const LANGUAGES = [
-  { code: 'marathi', label: 'मराठी (Marathi)', flag: '🇮🇳' },
-  { code: 'spanish', label: 'Español (Spanish)', flag: '🇪🇸' },
-  { code: 'english', label: 'English', flag: '🇺🇸' },
-  { code: 'hindi', label: 'हिन्दी (Hindi)', flag: '🇮🇳' },
-  { code: 'french', label: 'Français (French)', flag: '🇫🇷' },
-  { code: 'german', label: 'Deutsch (German)', flag: '🇩🇪' },
-]
-
 export default function Login() {
   const [loading, setLoading] = useState(false)
   const [activeTab, setActiveTab] = useState('login')
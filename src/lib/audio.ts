@@ -1,45 +1,74 @@
+// Lazily created and reused; browsers cap the number of live AudioContexts.
+let sharedContext: AudioContext | null = null;
+
+const getSharedContext = () => {
+  if (!sharedContext || sharedContext.state === 'closed') {
+    sharedContext = new (window.AudioContext || (window as any).webkitAudioContext)();
+  }
+  if (sharedContext.state === 'suspended') {
+    sharedContext.resume().catch(() => {});
+  }
+  return sharedContext;
+};
+
+const RING_FREQUENCY = 440; // A4
+const RING_GAIN = 0.1;
+const RING_PERIOD_S = 4.5;
+// Ring pattern: on for 1s, off for 0.5s, on for 1s, then silent until the period repeats
+const RING_BURSTS: [number, number][] = [[0, 1], [1.5, 2.5]];
+
+// Render one full ring period so playback is a single looping buffer source
+const renderRingBuffer = (audioContext: AudioContext) => {
+  const rate = audioContext.sampleRate;
+  const buffer = audioContext.createBuffer(1, Math.round(RING_PERIOD_S * rate), rate);
+  const data = buffer.getChannelData(0);
+  const step = (2 * Math.PI * RING_FREQUENCY) / rate;
+
+  for (const [start, end] of RING_BURSTS) {
+    for (let i = Math.round(start * rate); i < Math.round(end * rate); i++) {
+      data[i] = RING_GAIN * Math.sin(i * step);
+    }
+  }
+  return buffer;
+};
+
+// Rendered once per page and shared by every RingToneGenerator instance
+let ringBuffer: AudioBuffer | null = null;
+
+const getRingBuffer = (audioContext: AudioContext) => {
+  if (!ringBuffer || ringBuffer.sampleRate !== audioContext.sampleRate) {
+    ringBuffer = renderRingBuffer(audioContext);
+  }
+  return ringBuffer;
+};
+
+// Create/resume the shared context from a user gesture so the first sound of a call
+// doesn't pay context startup or get blocked by autoplay policy
+export const warmUpAudio = () => {
+  try {
+    getRingBuffer(getSharedContext());
+  } catch (error) {
+    console.error('Failed to warm up audio:', error);
+  }
+};
+
 export class RingToneGenerator {
-  private audioContext: AudioContext | null = null;
-  private oscillator: OscillatorNode | null = null;
-  private gainNode: GainNode | null = null;
+  private source: AudioBufferSourceNode | null = null;
   private isPlaying = false;
 
   async start() {
     if (this.isPlaying) return;
 
     try {
-      this.audioContext = new (window.AudioContext || (window as any).webkitAudioContext)();
-      this.oscillator = this.audioContext.createOscillator();
-      this.gainNode = this.audioContext.createGain();
-
-      this.oscillator.connect(this.gainNode);
-      this.gainNode.connect(this.audioContext.destination);
-
-      // Create a pleasant ring tone pattern
-      this.oscillator.frequency.setValueAtTime(440, this.audioContext.currentTime); // A4
-      this.gainNode.gain.setValueAtTime(0, this.audioContext.currentTime);
-      
-      // Ring pattern: on for 1s, off for 0.5s, on for 1s, off for 3s
-      const now = this.audioContext.currentTime;
-      this.gainNode.gain.setValueAtTime(0.1, now);
-      this.gainNode.gain.setValueAtTime(0.1, now + 1);
-      this.gainNode.gain.setValueAtTime(0, now + 1);
-      this.gainNode.gain.setValueAtTime(0, now + 1.5);
-      this.gainNode.gain.setValueAtTime(0.1, now + 1.5);
-      this.gainNode.gain.setValueAtTime(0.1, now + 2.5);
-      this.gainNode.gain.setValueAtTime(0, now + 2.5);
-
-      this.oscillator.start();
-      this.isPlaying = true;
+      const audioContext = getSharedContext();
 
-      // Auto-repeat every 4.5 seconds
-      setTimeout(() => {
-        if (this.isPlaying) {
-          this.stop();
-          this.start();
-        }
-      }, 4500);
+      this.source = audioContext.createBufferSource();
+      this.source.buffer = getRingBuffer(audioContext);
+      this.source.loop = true;
+      this.source.connect(audioContext.destination);
 
+      this.source.start();
+      this.isPlaying = true;
     } catch (error) {
       console.error('Failed to start ring tone:', error);
     }
@@ -49,33 +78,29 @@ export class RingToneGenerator {
     if (!this.isPlaying) return;
 
     try {
-      if (this.oscillator) {
-        this.oscillator.stop();
-        this.oscillator.disconnect();
-      }
-      if (this.gainNode) {
-        this.gainNode.disconnect();
-      }
-      if (this.audioContext) {
-        this.audioContext.close();
+      if (this.source) {
+        this.source.stop();
+        this.source.disconnect();
       }
     } catch (error) {
       console.error('Error stopping ring tone:', error);
     }
 
-    this.oscillator = null;
-    this.gainNode = null;
-    this.audioContext = null;
+    this.source = null;
     this.isPlaying = false;
   }
 }
 
 export const playNotificationSound = () => {
   try {
-    const audioContext = new (window.AudioContext || (window as any).webkitAudioContext)();
+    const audioContext = getSharedContext();
     const oscillator = audioContext.createOscillator();
     const gainNode = audioContext.createGain();
 
+    oscillator.onended = () => {
+      oscillator.disconnect();
+      gainNode.disconnect();
+    };
     oscillator.connect(gainNode);
     gainNode.connect(audioContext.destination);
 
@@ -0,0 +1,19 @@
+export type Language = {
+  code: string
+  label: string
+  flag: string
+}
+
+export const LANGUAGES: Language[] = [
+  { code: 'marathi', label: 'मराठी (Marathi)', flag: '🇮🇳' },
+  { code: 'spanish', label: 'Español (Spanish)', flag: '🇪🇸' },
+  { code: 'english', label: 'English', flag: '🇺🇸' },
+  { code: 'hindi', label: 'हिन्दी (Hindi)', flag: '🇮🇳' },
+  { code: 'french', label: 'Français (French)', flag: '🇫🇷' },
+  { code: 'german', label: 'Deutsch (German)', flag: '🇩🇪' },
+]
+
+// Built once so per-render lookups by code don't rescan the list
+const LANGUAGE_BY_CODE = new Map(LANGUAGES.map((lang): [string, Language] => [lang.code, lang]))
+
+export const getLangInfo = (code: string) => LANGUAGE_BY_CODE.get(code)
@@ -4,21 +4,47 @@ export type RealtimeHandle = {
   hangup: () => void;
   setTargetLanguage: (lang: string) => void;
   setVoice: (voice: string) => void;
+  setMuted: (muted: boolean) => void;
 };
 
+// Transcription model for the local speaker's own audio; override with VITE_ASR_MODEL.
+const ASR_MODEL = import.meta.env.VITE_ASR_MODEL || "gpt-4o-mini-transcribe";
+
+// Upper bound on ICE gathering before sending the offer with whatever candidates we have.
+const ICE_GATHERING_TIMEOUT_MS = 1500;
+
 function waitForIceGathering(pc: RTCPeerConnection) {
   if (pc.iceGatheringState === "complete") return Promise.resolve();
   return new Promise<void>((resolve) => {
+    const done = () => {
+      clearTimeout(timer);
+      pc.removeEventListener("icegatheringstatechange", cb);
+      resolve();
+    };
     const cb = () => {
-      if (pc.iceGatheringState === "complete") {
-        pc.removeEventListener("icegatheringstatechange", cb);
-        resolve();
-      }
+      if (pc.iceGatheringState === "complete") done();
     };
+    const timer = setTimeout(done, ICE_GATHERING_TIMEOUT_MS);
     pc.addEventListener("icegatheringstatechange", cb);
   });
 }
 
+async function fetchEphemeralKey(): Promise<string> {
+  const tokenResponse = await fetch('/api/token');
+  if (!tokenResponse.ok) {
+    throw new Error(`Token request failed: ${await tokenResponse.text()}`);
+  }
+
+  const data = await tokenResponse.json();
+  // GA client_secrets returns { value }; the older sessions endpoint nests it in client_secret
+  const key = data?.value ?? data?.client_secret?.value;
+
+  if (!key) {
+    throw new Error("No ephemeral key in response");
+  }
+  return key;
+}
+
 export async function startRealtime({
   targetLanguage,
   voice,
@@ -35,24 +61,22 @@ export async function startRealtime({
   onError?: (e: any) => void;
 }): Promise<RealtimeHandle> {
   try {
-    // Get ephemeral token
-    const tokenResponse = await fetch('/api/token');
-    if (!tokenResponse.ok) {
-      throw new Error(`Token request failed: ${await tokenResponse.text()}`);
-    }
-    
-    const data = await tokenResponse.json();
-    const EPHEMERAL_KEY = data?.client_secret?.value;
-
-    if (!EPHEMERAL_KEY) {
-      throw new Error("No ephemeral key in response");
-    }
-
-    // Get user media
-    const stream = await navigator.mediaDevices.getUserMedia({
+    // Token fetch and microphone permission are independent, so run them concurrently
+    const tokenPromise = fetchEphemeralKey();
+    const mediaPromise = navigator.mediaDevices.getUserMedia({
       audio: { echoCancellation: true, noiseSuppression: true, autoGainControl: true },
     });
 
+    let EPHEMERAL_KEY: string;
+    let stream: MediaStream;
+    try {
+      [EPHEMERAL_KEY, stream] = await Promise.all([tokenPromise, mediaPromise]);
+    } catch (e) {
+      // Release the microphone if it was granted but the other request failed
+      mediaPromise.then((s) => s.getTracks().forEach((t) => t.stop()), () => {});
+      throw e;
+    }
+
     // Create peer connection
     const pc = new RTCPeerConnection({
       iceServers: [{ urls: ["stun:stun.l.google.com:19302"] }],
@@ -72,9 +96,24 @@ export async function startRealtime({
     const dc = pc.createDataChannel("oai-events");
     let dcOpen = false;
     let buf = "";
+    // Deltas arrive per token; emit at most one partial per animation frame
+    let partialFrame: number | null = null;
 
+    const cancelPartial = () => {
+      if (partialFrame !== null) cancelAnimationFrame(partialFrame);
+      partialFrame = null;
+    };
+
+    const flushPartial = () => {
+      partialFrame = null;
+      onPartial?.(buf);
+    };
+
+    // The SDP exchange uses the GA /v1/realtime/calls endpoint, so updates follow the GA
+    // session shape; any unknown (beta-style) key rejects the whole update.
     const pushSessionUpdate = (update: any) =>
-      dcOpen && dc.send(JSON.stringify({ type: "session.update", session: update }));
+      dcOpen &&
+      dc.send(JSON.stringify({ type: "session.update", session: { type: "realtime", ...update } }));
 
     const setTargetLanguage = (lang: string) => {
       const instr =
@@ -83,10 +122,24 @@ export async function startRealtime({
       pushSessionUpdate({ instructions: instr });
     };
 
-    const setVoice = (v: string) => pushSessionUpdate({ voice: v });
+    const setVoice = (v: string) => pushSessionUpdate({ audio: { output: { voice: v } } });
 
     dc.onopen = () => {
       dcOpen = true;
+      pushSessionUpdate({
+        audio: {
+          input: {
+            transcription: { model: ASR_MODEL },
+            // Same as the session defaults; pinned so a server-side default change cannot move turn boundaries.
+            turn_detection: {
+              type: "server_vad",
+              threshold: 0.5,
+              prefix_padding_ms: 300,
+              silence_duration_ms: 500,
+            },
+          },
+        },
+      });
       setVoice(voice);
       setTargetLanguage(targetLanguage);
     };
@@ -101,21 +154,26 @@ export async function startRealtime({
 
       switch (msg.type) {
         case "input_audio_buffer.speech_started":
+          cancelPartial();
           buf = "";
           break;
-        case "input_audio_buffer.transcription.completed":
-          const src = msg.transcript ?? msg.text ?? "";
+        case "conversation.item.input_audio_transcription.completed": {
+          const src = msg.transcript ?? "";
           if (src) onSourceFinal?.(src);
           break;
+        }
         case "response.text.delta":
         case "response.output_text.delta":
         case "response.delta":
+        case "response.output_audio_transcript.delta":
           buf += msg.delta ?? "";
-          onPartial?.(buf);
+          if (partialFrame === null) partialFrame = requestAnimationFrame(flushPartial);
           break;
         case "response.output_text.done":
+        case "response.output_audio_transcript.done":
         case "response.completed":
         case "response.done":
+          cancelPartial();
           if (buf.trim()) onFinal?.(buf);
           buf = "";
           break;
@@ -149,14 +207,20 @@ export async function startRealtime({
     };
     await pc.setRemoteDescription(answer);
 
+    // A disabled track sends silence, which server VAD never forwards to transcription
+    const setMuted = (muted: boolean) => {
+      track.enabled = !muted;
+    };
+
     const hangup = () => {
+      cancelPartial();
       try { dc.close(); } catch {}
       pc.getSenders().forEach((s) => s.track?.stop());
       pc.close();
       stream.getTracks().forEach((t) => t.stop());
     };
 
-    return { pc, dc, hangup, setTargetLanguage, setVoice };
+    return { pc, dc, hangup, setTargetLanguage, setVoice, setMuted };
   } catch (e) {
     onError?.(e);
     throw e;